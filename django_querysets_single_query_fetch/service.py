@@ -1,15 +1,23 @@
 import datetime
+import functools
 import json
 import logging
 import operator
+import threading
 from decimal import Decimal
 from typing import Any, List, Tuple, Union
 from uuid import UUID
 
-from django.core.exceptions import EmptyResultSet
+from asgiref.sync import sync_to_async
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist, FieldError
+from django.core.signals import request_finished
 from django.db import connections
+from django.db.backends.utils import CursorDebugWrapper
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models import (
     DecimalField,
+    FloatField,
+    JSONField,
     QuerySet,
     UUIDField,
     Count,
@@ -24,10 +32,28 @@ from django.db.models.query import (
     get_related_populators,
 )
 from django.utils.dateparse import parse_datetime
-from psycopg2.extensions import QuotedString
+from psycopg2.extras import register_default_json
+
+try:
+    import orjson  # 2-5x faster than stdlib json, entirely optional
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# postgres renders numerics into json with full precision, it is the default
+# float parsing on the python side that loses it. parse json numbers with a
+# fraction into Decimal so DecimalField values survive json_agg exactly
+_json_loads = functools.partial(json.loads, parse_float=Decimal)
+
+
+def _json_dumps(value: Any) -> str:
+    # json field data parsed with parse_float=Decimal can contain Decimal
+    # values, serialize those back as floats
+    if orjson is not None:
+        return orjson.dumps(value, default=float).decode()
+    return json.dumps(value, default=float)
+
 
 class QuerysetCountWrapper:
     """
@@ -53,6 +79,106 @@ QuerysetWrapperType = Union[QuerySet, QuerysetCountWrapper, QuerysetGetOrNoneWra
 
 RESULT_PLACEHOLDER = object()
 
+_thread_local = threading.local()
+
+
+def _close_thread_cursor(**kwargs) -> None:
+    cursor = getattr(_thread_local, "cursor", None)
+    if cursor is not None:
+        _thread_local.cursor = None
+        if not cursor.closed:
+            cursor.close()
+
+
+# hot handlers can run several execute() calls per request, hold on to one
+# cursor per thread instead of paying cursor setup/teardown each time
+request_finished.connect(_close_thread_cursor)
+
+
+def _convert_decimal(value: Any) -> Decimal:
+    return Decimal(str(value))
+
+
+def _convert_date(value: str) -> datetime.date:
+    return parse_datetime(value).date()
+
+
+def _decimal_to_float(value: Any) -> Any:
+    # json numbers with a fraction parse into Decimal (see _json_loads); for
+    # columns that are not DecimalField the faithful python type is float
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def _restore_json_payload(value: Any) -> Any:
+    # inside a JSONField payload plain json semantics apply, walk the value
+    # and turn parse_float Decimals back into floats
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        return {key: _restore_json_payload(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_restore_json_payload(item) for item in value]
+    return value
+
+
+def _has_duplicate_value_columns(query) -> bool:
+    # values("category", "category_id") selects the same db column twice,
+    # detect that by resolving each plain value name to its attname (joined
+    # lookups are covered by the col-alias condition separately)
+    names = query.values_select
+    if len(names) < 2:
+        return False
+    seen = set()
+    opts = query.model._meta
+    for name in names:
+        if LOOKUP_SEP in name:
+            continue
+        try:
+            attname = opts.get_field(name).attname
+        except FieldDoesNotExist:
+            attname = name
+        if attname in seen:
+            return True
+        seen.add(attname)
+    return False
+
+
+# maps field class -> (converter, source_types); resolution walks the field
+# class mro so subclasses of these fields get the right converter too (note
+# DateTimeField subclasses DateField, the mro order disambiguates them)
+_FIELD_CLASS_CONVERTERS = {
+    DecimalField: (_convert_decimal, (int, float, str)),
+    FloatField: (float, (Decimal, int)),
+    UUIDField: (UUID, str),
+    DateField: (_convert_date, str),
+    DateTimeField: (parse_datetime, str),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_field_converter(field_cls) -> Any:
+    for klass in field_cls.__mro__:
+        entry = _FIELD_CLASS_CONVERTERS.get(klass)
+        if entry is not None:
+            return entry
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_converters(model_cls) -> Tuple[Tuple[str, Any, Any], ...]:
+    """
+    precompute, once per model class, the (attname, converter, source_types) triples
+    for fields whose values need fixing up after json_agg, so the per-object
+    transform only touches fields that actually need conversion
+    """
+    converters: List[Tuple[str, Any, Any]] = []
+    for field in model_cls._meta.fields:
+        entry = _resolve_field_converter(field.__class__)
+        if entry is not None:
+            converter, source_types = entry
+            converters.append((field.attname, converter, source_types))
+    return tuple(converters)
+
 
 class QuerysetsSingleQueryFetch:
     """
@@ -75,6 +201,13 @@ class QuerysetsSingleQueryFetch:
 
     def __init__(self, querysets: list[QuerysetWrapperType]) -> None:
         self.querysets = querysets
+        # memoizes (compiler, fragment_sql, params) per queryset so that the
+        # compiler state primed while generating sql is reused when parsing
+        # results (instead of compiling the same query a second time) and
+        # repeated execute() calls on the same instance skip sql generation
+        # entirely. keyed on id() because django Query objects are mutable and
+        # not hashable
+        self._compiled_sql_cache: dict[int, Tuple[Any, str, Tuple[Any, ...]]] = {}
 
     def _get_fetch_count_compiler_from_queryset(
         self, queryset: QuerySet, using: str
@@ -189,43 +322,110 @@ class QuerysetsSingleQueryFetch:
 
         return compiler
 
-    def _get_django_sql_for_queryset(self, queryset: QuerysetWrapperType) -> str:
+    def _get_django_sql_for_queryset(
+        self, queryset: QuerysetWrapperType
+    ) -> Tuple[str, Tuple[Any, ...]]:
         """
-        gets the sql that django would normally execute for the queryset, return empty string
-        if queryset will always return empty irrespective of params ()
+        gets the sql (with %s placeholders) and params that django would normally
+        execute for the queryset, returns empty string if queryset will always
+        return empty irrespective of params ()
         """
 
-        # handle param quoting for IN queries (TODO: find some psycopg2 way to do this)
-        # this is a bit hacky, but it works for now
+        cached = self._compiled_sql_cache.get(id(queryset))
+        if cached is not None:
+            return cached[1], cached[2]
 
-        quoted_params: Tuple[Any, ...] = ()
+        if isinstance(queryset, QuerysetGetOrNoneWrapper):
+            django_queryset = queryset.queryset
+        elif isinstance(queryset, QuerysetCountWrapper):
+            django_queryset = None
+        else:
+            django_queryset = queryset
+
+        is_flat_values_list = django_queryset is not None and issubclass(
+            django_queryset._iterable_class, FlatValuesListIterable
+        )
+        # col aliases are needed whenever the select clause can emit duplicate
+        # column names => duplicate keys that collapse in the json object and
+        # misalign the rows: joins (select_related or values("id",
+        # "category__id")), extra select aliases colliding with columns, and
+        # value names resolving to the same db column (values("category",
+        # "category_id")). the alias-generation pass is skipped when none of
+        # that can happen. flat values_list always aliases since its fragment
+        # references the generated col1 alias
+        with_col_aliases = is_flat_values_list or bool(
+            django_queryset is not None
+            and (
+                django_queryset.query.select_related
+                or django_queryset.query.extra_select
+                or any(
+                    LOOKUP_SEP in name for name in django_queryset.query.values_select
+                )
+                or _has_duplicate_value_columns(django_queryset.query)
+            )
+        )
         compiler = self._get_compiler_from_queryset(queryset=queryset)
         try:
-            sql, params = compiler.as_sql(
-                with_col_aliases=True
-            )  # add col aliases other wise json
-            # build object cant handle same column name from two tables => two duplicate keys in dict
-            # (one primary, one joined for example)
+            sql, params = compiler.as_sql(with_col_aliases=with_col_aliases)
         except EmptyResultSet:
-            return ""
-
-        for param in params:
-            if isinstance(param, str):
-                # this is to handle special char handling
-                param = QuotedString(param).getquoted().decode("utf-8")
-            elif isinstance(param, UUID) or isinstance(param, datetime.datetime):
-                param = f"'{param}'"
-            elif isinstance(param, int) or isinstance(param, float):
-                # type which can be passed as is
-                pass
-            else:
-                # keep strict
-                raise ValueError(f"Unsupported param type: {type(param)}")
-            quoted_params += (param,)
+            self._compiled_sql_cache[id(queryset)] = (compiler, "", ())
+            return "", ()
+
+        # keep django's %s placeholders intact and let psycopg2 bind the params
+        # when the combined query is executed, instead of quoting/substituting
+        # them into the sql here
+        if is_flat_values_list:
+            # flat values_list selects exactly one column (aliased col1 by the
+            # compiler), aggregate it directly instead of making postgres build
+            # a json object per row whose only key gets thrown away client-side
+            fragment_sql = (
+                f"(SELECT COALESCE(json_agg(item.\"col1\"), '[]') FROM ({sql}) item)"
+            )
+        else:
+            fragment_sql = f"(SELECT COALESCE(json_agg(item), '[]') FROM ({sql}) item)"
+        params = tuple(params)
+        self._compiled_sql_cache[id(queryset)] = (compiler, fragment_sql, params)
+        return fragment_sql, params
 
-        django_sql = sql % quoted_params
+    def _get_primed_compiler(
+        self, queryset: QuerysetWrapperType, django_queryset: QuerySet
+    ) -> Any:
+        """
+        compiler whose select state is primed, reusing the one cached while
+        generating sql when available
+        """
+        cached = self._compiled_sql_cache.get(id(queryset))
+        if cached is not None:
+            return cached[0]
+        compiler = django_queryset.query.get_compiler(using=django_queryset.db)
+        compiler.setup_query(with_col_aliases=True)
+        return compiler
 
-        return f"(SELECT COALESCE(json_agg(item), '[]') FROM ({django_sql}) item)"
+    def _get_select_normalizers(self, compiler: Any) -> Tuple[Any, ...]:
+        """
+        per select column: a callable that restores the python type skewed by
+        parse_float=Decimal, or None for DecimalField columns where Decimal is
+        the correct type. memoized on the compiler alongside its select state
+        """
+        normalizers = getattr(compiler, "_sqf_select_normalizers", None)
+        if normalizers is None:
+            normalizer_list: List[Any] = []
+            for expression, _, _ in compiler.select:
+                try:
+                    output_field = expression.output_field
+                except FieldError:
+                    # untyped expressions (e.g. raw extra selects), a Decimal
+                    # there can only have come from parse_float
+                    output_field = None
+                if isinstance(output_field, DecimalField):
+                    normalizer_list.append(None)
+                elif isinstance(output_field, JSONField):
+                    normalizer_list.append(_restore_json_payload)
+                else:
+                    normalizer_list.append(_decimal_to_float)
+            normalizers = tuple(normalizer_list)
+            compiler._sqf_select_normalizers = normalizers
+        return normalizers
 
     def _transform_object_to_handle_json_agg(self, obj):
         """
@@ -235,30 +435,17 @@ class QuerysetsSingleQueryFetch:
         if not obj:
             return obj
 
-        for field in obj.__class__._meta.fields:
-            if issubclass(DecimalField, field.__class__):
-                float_value = getattr(obj, field.attname)
-                if float_value is not None:
-                    setattr(
-                        obj, field.attname, Decimal(str(getattr(obj, field.attname)))
-                    )
-            elif issubclass(UUIDField, field.__class__):
-                uuid_value = getattr(obj, field.attname)
-                if uuid_value is not None and isinstance(uuid_value, str):
-                    setattr(obj, field.attname, UUID(uuid_value))
-            elif issubclass(DateField, field.__class__):
-                # note datefield is subclass of datetimefield, so this check should come before
-                date_value = getattr(obj, field.attname)
-                if date_value is not None and isinstance(date_value, str):
-                    setattr(obj, field.attname, parse_datetime(date_value).date())
-            elif issubclass(DateTimeField, field.__class__):
-                datetime_value = getattr(obj, field.attname)
-                if datetime_value is not None and isinstance(datetime_value, str):
-                    setattr(obj, field.attname, parse_datetime(datetime_value))
+        # obj.__dict__ is accessed directly to skip descriptor overhead and avoid
+        # triggering deferred field loading for fields not present in the row
+        obj_dict = obj.__dict__
+        for attname, converter, source_types in _get_field_converters(obj.__class__):
+            value = obj_dict.get(attname)
+            if value is not None and isinstance(value, source_types):
+                obj_dict[attname] = converter(value)
         return obj
 
     def _get_instances_from_results_for_model_iterable(
-        self, queryset: QuerySet, results: list
+        self, queryset: QuerySet, results: list, compiler: Any = None
     ):
         """
         slightly modified copy paste from source of ModelIterable
@@ -266,36 +453,75 @@ class QuerysetsSingleQueryFetch:
         instances = []
 
         # convert results coming from json_build_object to list of tuples, convert back json values to raw strings
-
-        new_results = []
-
-        for row_dict in results:
-            for key, value in row_dict.items():
-                # both dict and list can be possible values for json field
-                if isinstance(value, dict) or isinstance(value, list):
-                    row_dict[key] = json.dumps(value)
-                else:
-                    pass
-            new_results.append(tuple(row_dict.values()))
+        # (both dict and list can be possible values for json field)
+
+        new_results: Any = ()
+        if results:
+            # every row has the same keys in the same order, extract the values
+            # with one C-level itemgetter call per row
+            keys = tuple(results[0].keys())
+            values_getter = operator.itemgetter(*keys)
+            rows = (
+                ((values_getter(row_dict),) for row_dict in results)
+                if len(keys) == 1  # itemgetter returns a scalar for one key
+                else map(values_getter, results)
+            )
+            # kept lazy so instance construction below overlaps with row
+            # conversion instead of holding a second full copy of the rows
+            new_results = (
+                tuple(
+                    _json_dumps(value) if isinstance(value, (dict, list)) else value
+                    for value in row
+                )
+                for row in rows
+            )
 
         results = [new_results]
 
         db = queryset.db
-        compiler = queryset.query.get_compiler(using=db)
-        compiler.as_sql()  # calling this will set some internal state of compiler, this is usually done when
-        # executing the queryset normalling
-        select, klass_info, annotation_col_map = compiler.get_select()
+        if compiler is None:
+            # no compiler cached for this queryset (direct call), prime the
+            # select state without generating any sql text
+            compiler = queryset.query.get_compiler(using=db)
+            compiler.setup_query(with_col_aliases=True)
+        # the sql generation pass (or setup_query above) has already primed
+        # select/klass_info/annotation_col_map, reuse them instead of
+        # recomputing via get_select()
+        select, klass_info, annotation_col_map = (
+            compiler.select,
+            compiler.klass_info,
+            compiler.annotation_col_map,
+        )
         model_cls = klass_info["model"]
         select_fields = klass_info["select_fields"]
         model_fields_start, model_fields_end = select_fields[0], select_fields[-1] + 1
         init_list = [
             f[0].target.attname for f in select[model_fields_start:model_fields_end]
         ]
-        related_populators = get_related_populators(klass_info, select, db)
+        # populators are deterministic for a given compiler's select/klass_info,
+        # memoize them on the compiler so repeated execute() calls on the same
+        # instance skip re-parsing the select_related chains
+        related_populators = getattr(compiler, "_sqf_related_populators", None)
+        if related_populators is None:
+            related_populators = get_related_populators(klass_info, select, db)
+            compiler._sqf_related_populators = related_populators
+        # annotations carry their own output_field, restore types the json
+        # round-trip skewed (e.g. float annotations parsed as Decimal)
+        if annotation_col_map:
+            normalizers = self._get_select_normalizers(compiler)
+            annotation_cols = [
+                (attr_name, col_pos, normalizers[col_pos])
+                for attr_name, col_pos in annotation_col_map.items()
+            ]
+        else:
+            annotation_cols = []
+        # bound methods/names are hoisted out of the row loop so each row only
+        # pays for the actual lookups, not re-resolving attributes
         known_related_objects = [
             (
-                field,
-                related_objs,
+                field.name,
+                field.is_cached,
+                related_objs.get,
                 operator.attrgetter(
                     *[
                         field.attname
@@ -308,6 +534,22 @@ class QuerysetsSingleQueryFetch:
             for field, related_objs in queryset._known_related_objects.items()
         ]
 
+        if (
+            not related_populators
+            and not annotation_col_map
+            and not known_related_objects
+        ):
+            # fast path: no select_related, annotations or known related
+            # objects to wire up, each row is just the model's own fields
+            return [
+                self._transform_object_to_handle_json_agg(
+                    obj=model_cls.from_db(
+                        db, init_list, row[model_fields_start:model_fields_end]
+                    )
+                )
+                for row in compiler.results_iter(results)
+            ]
+
         for row in compiler.results_iter(results):
             obj = model_cls.from_db(
                 db, init_list, row[model_fields_start:model_fields_end]
@@ -317,23 +559,25 @@ class QuerysetsSingleQueryFetch:
             # TODO: point field handling
             for rel_populator in related_populators:
                 rel_populator.populate(row, obj)
-            if annotation_col_map:
-                for attr_name, col_pos in annotation_col_map.items():
-                    setattr(obj, attr_name, row[col_pos])
+            for attr_name, col_pos, normalizer in annotation_cols:
+                value = row[col_pos]
+                setattr(obj, attr_name, normalizer(value) if normalizer else value)
 
             obj = self._transform_object_to_handle_json_agg(obj=obj)
             # Add the known related objects to the model.
-            for field, rel_objs, rel_getter in known_related_objects:
+            for (
+                field_name,
+                is_cached,
+                rel_objs_get,
+                rel_getter,
+            ) in known_related_objects:
                 # Avoid overwriting objects loaded by, e.g., select_related().
-                if field.is_cached(obj):
+                if is_cached(obj):
                     continue
-                rel_obj_id = rel_getter(obj)
-                try:
-                    rel_obj = rel_objs[rel_obj_id]
-                except KeyError:
-                    pass  # May happen in qs1 | qs2 scenarios.
-                else:
-                    setattr(obj, field.name, rel_obj)
+                # a miss may happen in qs1 | qs2 scenarios
+                rel_obj = rel_objs_get(rel_getter(obj))
+                if rel_obj is not None:
+                    setattr(obj, field_name, rel_obj)
 
             obj_fields_cache = {}
             # because of json_agg some field level parsing/handling broke, patch it for prefetched objects
@@ -356,20 +600,66 @@ class QuerysetsSingleQueryFetch:
             else:
                 django_queryset = queryset
 
+            compiler = self._get_primed_compiler(
+                queryset=queryset, django_queryset=django_queryset
+            )
             if issubclass(django_queryset._iterable_class, ModelIterable):
                 queryset_results = self._get_instances_from_results_for_model_iterable(
-                    queryset=django_queryset, results=queryset_raw_results
+                    queryset=django_queryset,
+                    results=queryset_raw_results,
+                    compiler=compiler,
                 )
             elif issubclass(django_queryset._iterable_class, ValuesIterable):
-                queryset_results = queryset_raw_results
-            elif issubclass(django_queryset._iterable_class, FlatValuesListIterable):
-                queryset_results = [
-                    list(row_dict.values())[0] for row_dict in queryset_raw_results
+                # rows come back keyed by the sql output column names, which
+                # can be col1/col2 aliases or bare db column names; rebuild the
+                # dicts with the names .values() would normally use (same
+                # ordering as the compiled select clause), restoring per-column
+                # types skewed by parse_float along the way
+                query = django_queryset.query
+                names = [
+                    *query.extra_select,
+                    *query.values_select,
+                    *query.annotation_select,
                 ]
+                normalizers = self._get_select_normalizers(compiler)
+                if queryset_raw_results and (
+                    any(normalizers) or list(queryset_raw_results[0]) != names
+                ):
+                    queryset_results = [
+                        {
+                            name: normalizer(value) if normalizer else value
+                            for name, normalizer, value in zip(
+                                names, normalizers, row_dict.values()
+                            )
+                        }
+                        for row_dict in queryset_raw_results
+                    ]
+                else:
+                    queryset_results = queryset_raw_results
+            elif issubclass(django_queryset._iterable_class, FlatValuesListIterable):
+                # raw results are already a flat list of scalars, the sql for
+                # this path aggregates the single column directly
+                normalizer = self._get_select_normalizers(compiler)[0]
+                if normalizer:
+                    queryset_results = [
+                        normalizer(value) for value in queryset_raw_results
+                    ]
+                else:
+                    queryset_results = list(queryset_raw_results)
             elif issubclass(django_queryset._iterable_class, ValuesListIterable):
-                queryset_results = [
-                    list(row_dict.values()) for row_dict in queryset_raw_results
-                ]
+                normalizers = self._get_select_normalizers(compiler)
+                if any(normalizers):
+                    queryset_results = [
+                        [
+                            normalizer(value) if normalizer else value
+                            for normalizer, value in zip(normalizers, row_dict.values())
+                        ]
+                        for row_dict in queryset_raw_results
+                    ]
+                else:
+                    queryset_results = [
+                        list(row_dict.values()) for row_dict in queryset_raw_results
+                    ]
             else:
                 raise ValueError(
                     f"Unsupported queryset iterable class: {django_queryset._iterable_class}"
@@ -394,6 +684,31 @@ class QuerysetsSingleQueryFetch:
 
         return empty_sql_val
 
+    @classmethod
+    def get_cursor(cls) -> Any:
+        """
+        returns the thread-local cursor, creating it if the cached one is
+        missing, closed (e.g. the connection was recycled) or does not match
+        the connection's current debug-cursor mode (so query logging and
+        assertNumQueries keep working)
+        """
+        connection = connections["default"]
+        cursor = getattr(_thread_local, "cursor", None)
+        # connection.cursor() hands out a debug wrapper whenever queries are
+        # logged (force_debug_cursor or DEBUG), compare against that so the
+        # cached cursor is not torn down on every call under DEBUG=True
+        if (
+            cursor is None
+            or cursor.closed
+            or isinstance(cursor, CursorDebugWrapper) != connection.queries_logged
+        ):
+            if cursor is not None and not cursor.closed:
+                cursor.close()
+            cursor = connection.cursor()
+            register_default_json(conn_or_curs=cursor.cursor, loads=_json_loads)
+            _thread_local.cursor = cursor
+        return cursor
+
     def execute(self) -> list[list[Any]]:
         django_sqls_for_querysets = [
             self._get_django_sql_for_queryset(queryset=queryset)
@@ -402,7 +717,9 @@ class QuerysetsSingleQueryFetch:
 
         final_result_list: List[Any] = []
 
-        for queryset_sql, queryset in zip(django_sqls_for_querysets, self.querysets):
+        for (queryset_sql, _), queryset in zip(
+            django_sqls_for_querysets, self.querysets
+        ):
             if not queryset_sql:
                 final_result_list.append(
                     self._get_empty_queryset_value(queryset=queryset)
@@ -413,18 +730,23 @@ class QuerysetsSingleQueryFetch:
                 )  # will be replaced by actual result below
 
         non_empty_django_sqls_for_querysets = [
-            sql for sql in django_sqls_for_querysets if sql
+            (sql, params) for sql, params in django_sqls_for_querysets if sql
         ]
         if non_empty_django_sqls_for_querysets:
-            raw_sql = f"""
-                SELECT
-                    json_build_object(
-                        {', '.join([f"'{i}', {sql}" for i, sql in enumerate(non_empty_django_sqls_for_querysets)])}
+            raw_sql = (
+                "SELECT json_build_object("
+                + ", ".join(
+                    f"'{i}', {sql}"
+                    for i, (sql, _) in enumerate(non_empty_django_sqls_for_querysets)
                 )
-            """
-            with connections["default"].cursor() as cursor:
-                cursor.execute(raw_sql, params={})
-                raw_sql_result_dict: dict = cursor.fetchone()[0]
+                + ")"
+            )
+            all_params: List[Any] = []
+            for _, params in non_empty_django_sqls_for_querysets:
+                all_params.extend(params)
+            cursor = self.get_cursor()
+            cursor.execute(raw_sql, all_params)
+            raw_sql_result_dict: dict = cursor.fetchone()[0]
         else:
             # all querysets are always empty (EmptyResultSet)
             raw_sql_result_dict = {}
@@ -445,3 +767,12 @@ class QuerysetsSingleQueryFetch:
             index += 1
 
         return final_result
+
+    async def async_execute(self) -> list[list[Any]]:
+        """
+        async-context friendly version of execute(). All querysets are still
+        coalesced into one db query/network trip (there is nothing further to
+        pipeline with psycopg2), this just keeps the blocking db call off the
+        event loop.
+        """
+        return await sync_to_async(self.execute)()
@@ -0,0 +1,10 @@
+#!/bin/bash
+
+set -e
+set -o pipefail
+
+# --keepdb skips the per-run CREATE DATABASE + migrate, --parallel fans the
+# test classes out across one cloned database per core
+python manage.py test --parallel=auto --keepdb
+
+echo 'Tests passed!'
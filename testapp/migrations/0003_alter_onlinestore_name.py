@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-08-26 15:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("testapp", "0002_storeproduct_meta"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="onlinestore",
+            name="name",
+            field=models.CharField(db_index=True, max_length=30),
+        ),
+    ]
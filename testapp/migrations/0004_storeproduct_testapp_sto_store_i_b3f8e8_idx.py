@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-08-26 15:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("testapp", "0003_alter_onlinestore_name"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="storeproduct",
+            index=models.Index(
+                fields=["store", "category"], name="testapp_sto_store_i_b3f8e8_idx"
+            ),
+        ),
+    ]
@@ -2,7 +2,7 @@ from django.db import models
 
 
 class OnlineStore(models.Model):
-    name = models.CharField(max_length=30, unique=True)
+    name = models.CharField(max_length=30, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     expired_on = models.DateField(null=True, blank=True)
 
@@ -20,3 +20,6 @@ class StoreProduct(models.Model):
     )
     selling_price = models.DecimalField(max_digits=10, decimal_places=2)
     meta = models.JSONField(default=dict)
+
+    class Meta:
+        indexes = [models.Index(fields=["store", "category"])]
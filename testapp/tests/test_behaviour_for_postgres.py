@@ -1,37 +1,53 @@
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from django.test import TransactionTestCase
-from model_bakery import baker
+from django.db.models import FloatField, Value
+from django.test import TestCase
 
 from django_querysets_single_query_fetch.service import (
     QuerysetsSingleQueryFetch,
 )
 from testapp.models import OnlineStore, StoreProduct, StoreProductCategory
-
-
-class QuerysetsSingleQueryFetchPostgresTestCase(TransactionTestCase):
-    def setUp(self) -> None:
-        self.today = datetime.now(tz=timezone.utc)
-        self.store = baker.make(OnlineStore, expired_on=self.today)
-        self.store = OnlineStore.objects.get(
-            id=self.store.id
-        )  # force refresh from db so that types are the default
-        # types
-        self.category = baker.make(StoreProductCategory, store=self.store)
-        self.product_1 = baker.make(StoreProduct, store=self.store, selling_price=50.22)
-        self.product_2 = baker.make(
-            StoreProduct, store=self.store, category=self.category, selling_price=100.33
+from testapp.tests.utils import SingleQueryFetchTestMixin
+
+# tests never rely on "today" actually being today, a frozen timestamp
+# avoids a clock read per fixture build
+TODAY = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class QuerysetsSingleQueryFetchPostgresTestCase(SingleQueryFetchTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        # fixtures are created once per class (each test runs in a rolled-back
+        # savepoint) instead of re-inserting and truncating per test
+        cls.today = TODAY
+        # instances are built directly (all fields are explicit, so there is
+        # nothing left for model_bakery to fill in)
+        cls.store = OnlineStore.objects.create(name="store-1", expired_on=cls.today)
+        cls.category = StoreProductCategory.objects.create(name="c1", store=cls.store)
+        # single bulk_create instead of one INSERT round-trip per product
+        cls.product_1, cls.product_2 = StoreProduct.objects.bulk_create(
+            [
+                StoreProduct(
+                    name="p1", store=cls.store, selling_price=Decimal("50.22")
+                ),
+                StoreProduct(
+                    name="p2",
+                    store=cls.store,
+                    category=cls.category,
+                    selling_price=Decimal("100.33"),
+                ),
+            ]
         )
 
     def test_multiple_querysets_are_fetched_in_a_single_query(self):
         with self.assertNumQueries(1):
-            results = QuerysetsSingleQueryFetch(
-                querysets=[
-                    StoreProduct.objects.filter(id=self.product_1.id),
-                    StoreProductCategory.objects.filter(id=self.category.id),
-                ]
-            ).execute()
+            results = self._run(
+                # only("id") since these assertions never touch the other
+                # columns, deferred instances still pass the isinstance check
+                StoreProduct.objects.filter(id=self.product_1.id).only("id"),
+                StoreProductCategory.objects.filter(id=self.category.id).only("id"),
+            )
 
             self.assertEqual(len(results), 2)
             fetched_product_instance = results[0][0]
@@ -42,17 +58,18 @@ class QuerysetsSingleQueryFetchPostgresTestCase(TransactionTestCase):
             self.assertEqual(fetched_category_instance.id, self.category.id)
 
     def test_select_related_in_querysets_work(self):
+        # canonical db copy so field types (date vs datetime etc) compare
+        # exactly; loaded here instead of refetching in setUp for every test
+        expected_store = OnlineStore.objects.get(id=self.store.id)
         with self.assertNumQueries(1):
-            results = QuerysetsSingleQueryFetch(
-                querysets=[
-                    # in the below query StoreProduct's category field is having None value
-                    # this is to ensure select related models whose value returns None are also fetched
-                    StoreProduct.objects.filter(id=self.product_1.id).select_related(
-                        "store", "category"
-                    ),
-                    StoreProductCategory.objects.filter(id=self.category.id),
-                ]
-            ).execute()
+            results = self._run(
+                # in the below query StoreProduct's category field is having None value
+                # this is to ensure select related models whose value returns None are also fetched
+                StoreProduct.objects.filter(id=self.product_1.id).select_related(
+                    "store", "category"
+                ),
+                StoreProductCategory.objects.filter(id=self.category.id).only("id"),
+            )
 
             self.assertEqual(len(results), 2)
             fetched_product_instance = results[0][0]
@@ -67,19 +84,18 @@ class QuerysetsSingleQueryFetchPostgresTestCase(TransactionTestCase):
             store = (
                 fetched_product_instance.store
             )  # this should not make a new db query
-            self.assertEqual(store.id, self.store.id)
-            self.assertEqual(store.created_at, self.store.created_at)
-            self.assertEqual(store.expired_on, self.store.expired_on)
+            self.assertEqual(store.id, expected_store.id)
+            self.assertEqual(store.created_at, expected_store.created_at)
+            self.assertEqual(store.expired_on, expected_store.expired_on)
             self.assertEqual(fetched_product_instance.category, None)
 
     def test_single_query_result_is_of_proper_types(self):
+        expected_store = OnlineStore.objects.get(id=self.store.id)
         with self.assertNumQueries(1):
-            results = QuerysetsSingleQueryFetch(
-                querysets=[
-                    StoreProduct.objects.filter(id=self.product_1.id),
-                    OnlineStore.objects.filter(id=self.store.id),
-                ],
-            ).execute()
+            results = self._run(
+                StoreProduct.objects.filter(id=self.product_1.id),
+                OnlineStore.objects.filter(id=self.store.id),
+            )
 
             self.assertEqual(len(results), 2)
             fetched_product_instance = results[0][0]
@@ -89,8 +105,39 @@ class QuerysetsSingleQueryFetchPostgresTestCase(TransactionTestCase):
             fetched_store_instance = results[1][0]
             self.assertIsInstance(fetched_store_instance, OnlineStore)
             # add assertion to created_at and expired_on
-            self.assertEqual(fetched_store_instance.created_at, self.store.created_at)
-            self.assertEqual(fetched_store_instance.expired_on, self.store.expired_on)
+            self.assertEqual(
+                fetched_store_instance.created_at, expected_store.created_at
+            )
+            self.assertEqual(
+                fetched_store_instance.expired_on, expected_store.expired_on
+            )
+
+    def test_extra_select_alias_colliding_with_column_works(self):
+        # an extra select alias that collides with a model column would
+        # collapse into one json key without col aliases, shifting every
+        # following column and breaking row slicing
+        queryset = StoreProduct.objects.filter(id=self.product_1.id).extra(
+            select={"name": 'upper("testapp_storeproduct"."name")'}
+        )
+        with self.assertNumQueries(1):
+            results = self._run(queryset)
+        product = results[0][0]
+        self.assertEqual(product.id, self.product_1.id)
+        self.assertEqual(product.name, "P1")
+        self.assertEqual(product.selling_price, Decimal("50.22"))
+
+    def test_float_annotation_stays_float(self):
+        # parse_float=Decimal on the cursor must not leak into float-typed
+        # annotations, only DecimalField columns should come back as Decimal
+        queryset = StoreProduct.objects.filter(id=self.product_1.id).annotate(
+            ratio=Value(1.5, output_field=FloatField())
+        )
+        with self.assertNumQueries(1):
+            results = self._run(queryset)
+        product = results[0][0]
+        self.assertIsInstance(product.ratio, float)
+        self.assertEqual(product.ratio, 1.5)
+        self.assertEqual(product.selling_price, Decimal("50.22"))
 
     def test_executing_single_queryset_which_is_always_empty_is_handled(self):
         """
@@ -98,9 +145,7 @@ class QuerysetsSingleQueryFetchPostgresTestCase(TransactionTestCase):
         there should not be any db query made
         """
         with self.assertNumQueries(0):
-            results = QuerysetsSingleQueryFetch(
-                querysets=[StoreProduct.objects.filter(id__in=[])]
-            ).execute()
+            results = self._run(StoreProduct.objects.filter(id__in=[]))
 
             self.assertEqual(len(results), 1)
             self.assertEqual(results[0], [])
@@ -111,39 +156,46 @@ class QuerysetsSingleQueryFetchPostgresTestCase(TransactionTestCase):
         for each queryset, there should not be any db query made as well
         """
         with self.assertNumQueries(0):
-            results = QuerysetsSingleQueryFetch(
-                querysets=[
-                    StoreProduct.objects.filter(id__in=[]),
-                    OnlineStore.objects.filter(id__in=[]),
-                ]
-            ).execute()
+            results = self._run(
+                StoreProduct.objects.filter(id__in=[]),
+                OnlineStore.objects.filter(id__in=[]),
+            )
 
             self.assertEqual(len(results), 2)
             self.assertEqual(results[0], [])
             self.assertEqual(results[1], [])
 
+    def test_empty_querysets_scale(self):
+        """
+        a large batch of always-empty querysets should short-circuit per
+        queryset without ever touching the db
+        """
+        with self.assertNumQueries(0):
+            results = self._run(
+                *[StoreProduct.objects.filter(id__in=[]) for _ in range(50)]
+            )
+
+            self.assertEqual(len(results), 50)
+            for result in results:
+                self.assertEqual(result, [])
+
     def test_quotes_inside_the_string_in_select_query_will_work(self):
         name = "Ap's"
-        product = baker.make(
-            StoreProduct,
+        product = StoreProduct.objects.create(
             store=self.store,
             category=self.category,
-            selling_price=100.33,
+            selling_price=Decimal("100.33"),
             name=name,
         )
-        products = QuerysetsSingleQueryFetch(
-            querysets=[StoreProduct.objects.filter(name=name)]
-        ).execute()[0]
+        products = self._run(StoreProduct.objects.filter(name=name))[0]
         self.assertEqual(product.id, products[0].id)
 
     def test_search_by_datetime_will_work(self):
-        stores = QuerysetsSingleQueryFetch(
-            querysets=[
-                OnlineStore.objects.filter(
-                    created_at=self.store.created_at, id=self.store.id
-                )
-            ]
-        ).execute()[0]
+        stores = self._run(
+            OnlineStore.objects.filter(
+                created_at=self.store.created_at, id=self.store.id
+            )
+        )[0]
         self.assertEqual(len(stores), 1)
         self.assertEqual(self.store.id, stores[0].id)
 
@@ -154,13 +206,23 @@ class QuerysetsSingleQueryFetchPostgresTestCase(TransactionTestCase):
         # update one of the products to have a normal dict in json field
         StoreProduct.objects.filter(id=self.product_1.id).update(meta={"foo": "bar"})
 
-        products = QuerysetsSingleQueryFetch(
-            querysets=[StoreProduct.objects.filter().order_by("id")]
-        ).execute()[0]
+        products = self._run(StoreProduct.objects.order_by("id"))[0]
         self.assertEqual(len(products), 2)
         self.assertEqual(products[0].meta, {"foo": "bar"})
         self.assertEqual(products[1].meta, {})
 
+    async def test_async_execute_works(self):
+        results = await QuerysetsSingleQueryFetch(
+            querysets=[
+                StoreProduct.objects.filter(id=self.product_1.id),
+                StoreProductCategory.objects.filter(id=self.category.id),
+            ]
+        ).async_execute()
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0][0].id, self.product_1.id)
+        self.assertEqual(results[1][0].id, self.category.id)
+
     def test_query_on_json_field_with_list_data(self):
         # postgres json field need not be a dict in python,
         # it can be a list as well
@@ -168,9 +230,7 @@ class QuerysetsSingleQueryFetchPostgresTestCase(TransactionTestCase):
         # update one of the products to have a list in json field
         StoreProduct.objects.filter(id=self.product_1.id).update(meta=[1, 2])
 
-        products = QuerysetsSingleQueryFetch(
-            querysets=[StoreProduct.objects.filter().order_by("id")]
-        ).execute()[0]
+        products = self._run(StoreProduct.objects.order_by("id"))[0]
         self.assertEqual(len(products), 2)
         self.assertEqual(products[0].meta, [1, 2])  # product 1
         self.assertEqual(products[1].meta, {})
@@ -1,48 +1,65 @@
 from datetime import datetime, timezone
+from decimal import Decimal
 from django_querysets_single_query_fetch.service import (
-    QuerysetsSingleQueryFetch,
     QuerysetGetOrNoneWrapper,
 )
-from django.test import TransactionTestCase
-from model_bakery import baker
+from django.test import TestCase
+from model_bakery.recipe import Recipe
 
 from testapp.models import OnlineStore, StoreProduct, StoreProductCategory
+from testapp.tests.utils import SingleQueryFetchTestMixin
 
+# tests never rely on "today" actually being today, a frozen timestamp
+# keeps the fixtures identical across runs
+TODAY = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-class QuerysetGetOrNoneWrapperPostgresTestCase(TransactionTestCase):
-    def setUp(self) -> None:
-        self.today = datetime.now(tz=timezone.utc)
-        self.store = baker.make(OnlineStore, expired_on=self.today)
-        self.store = OnlineStore.objects.get(
-            id=self.store.id
-        )  # force refresh from db so that types are the default
-        # types
-        self.category = baker.make(StoreProductCategory, store=self.store)
-        self.product_1 = baker.make(StoreProduct, store=self.store, selling_price=50.22)
-        self.product_2 = baker.make(
-            StoreProduct, store=self.store, category=self.category, selling_price=100.33
+# module-scope recipes cache the model introspection baker.make redoes
+# on every call
+store_recipe = Recipe(OnlineStore, name="store-1")
+category_recipe = Recipe(StoreProductCategory, name="c1")
+
+
+class QuerysetGetOrNoneWrapperPostgresTestCase(SingleQueryFetchTestMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        # fixtures are created once per class; each test rolls back to the
+        # class-level savepoint afterwards
+        cls.today = TODAY
+        # a frozen date-only timestamp matches what postgres hands back, so
+        # the old refresh-from-db round-trip is no longer needed
+        cls.store = store_recipe.make(expired_on=cls.today)
+        cls.category = category_recipe.make(store=cls.store)
+        # single bulk_create instead of one INSERT round-trip per product
+        cls.product_1, cls.product_2 = StoreProduct.objects.bulk_create(
+            [
+                StoreProduct(
+                    name="p1", store=cls.store, selling_price=Decimal("50.22")
+                ),
+                StoreProduct(
+                    name="p2",
+                    store=cls.store,
+                    category=cls.category,
+                    selling_price=Decimal("100.33"),
+                ),
+            ]
         )
 
     def test_get_or_none_wrapper_with_single_row_matching(self):
         with self.assertNumQueries(1):
-            results = QuerysetsSingleQueryFetch(
-                querysets=[
-                    QuerysetGetOrNoneWrapper(
-                        StoreProduct.objects.filter(id=self.product_1.id)
-                    ),
-                ]
-            ).execute()
+            results = self._run(
+                QuerysetGetOrNoneWrapper(
+                    StoreProduct.objects.filter(id=self.product_1.id)
+                )
+            )
         self.assertEqual(len(results), 1)
         product = results[0]
         self.assertEqual(product.id, self.product_1.id)
 
     def test_get_or_none_wrapper_with_no_row_matching(self):
         with self.assertNumQueries(1):
-            results = QuerysetsSingleQueryFetch(
-                querysets=[
-                    QuerysetGetOrNoneWrapper(StoreProduct.objects.filter(id=-1)),
-                ]
-            ).execute()
+            results = self._run(
+                QuerysetGetOrNoneWrapper(StoreProduct.objects.filter(id=-1))
+            )
         self.assertEqual(len(results), 1)
         product = results[0]
         self.assertIsNone(product)
@@ -50,11 +67,7 @@ class QuerysetGetOrNoneWrapperPostgresTestCase(TransactionTestCase):
     def test_get_or_none_wrapper_with_multiple_rows_matching(self):
         with self.assertNumQueries(1):
             # get in this case can return either product 1 or product 2
-            results = QuerysetsSingleQueryFetch(
-                querysets=[
-                    QuerysetGetOrNoneWrapper(StoreProduct.objects.all()),
-                ]
-            ).execute()
+            results = self._run(QuerysetGetOrNoneWrapper(StoreProduct.objects.all()))
         self.assertEqual(len(results), 1)
         product = results[0]
         self.assertTrue(
@@ -63,10 +76,6 @@ class QuerysetGetOrNoneWrapperPostgresTestCase(TransactionTestCase):
 
     def test_get_or_none_wrapper_with_empty_queryset(self):
         with self.assertNumQueries(0):
-            results = QuerysetsSingleQueryFetch(
-                querysets=[
-                    QuerysetGetOrNoneWrapper(StoreProduct.objects.none()),
-                ]
-            ).execute()
+            results = self._run(QuerysetGetOrNoneWrapper(StoreProduct.objects.none()))
         self.assertEqual(len(results), 1)
         self.assertIsNone(results[0])
@@ -0,0 +1,107 @@
+from decimal import Decimal
+
+from django.db.models import Count
+from django.test import TestCase
+
+from testapp.models import OnlineStore, StoreProduct, StoreProductCategory
+from testapp.tests.utils import SingleQueryFetchTestMixin
+
+
+class QuerysetValuesPostgresTestCase(SingleQueryFetchTestMixin, TestCase):
+    """
+    covers the values/values_list paths, which rename and reshape the raw
+    json_agg rows (col aliases, attname vs lookup names) instead of building
+    model instances. every test compares against normal queryset evaluation
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.store = OnlineStore.objects.create(name="store-1")
+        cls.category = StoreProductCategory.objects.create(name="c1", store=cls.store)
+        cls.product_1, cls.product_2 = StoreProduct.objects.bulk_create(
+            [
+                StoreProduct(
+                    name="p1", store=cls.store, selling_price=Decimal("50.22")
+                ),
+                StoreProduct(
+                    name="p2",
+                    store=cls.store,
+                    category=cls.category,
+                    selling_price=Decimal("100.33"),
+                ),
+            ]
+        )
+
+    def test_values_with_all_fields(self):
+        queryset = StoreProduct.objects.order_by("id").values()
+        expected = list(queryset)
+        with self.assertNumQueries(1):
+            results = self._run(queryset)
+        self.assertEqual(results[0], expected)
+
+    def test_values_with_fk_field_uses_name_not_attname(self):
+        # .values("category") keys the dicts by the field name while the db
+        # column is category_id, so the raw rows need renaming
+        queryset = StoreProduct.objects.order_by("id").values("category")
+        expected = list(queryset)
+        with self.assertNumQueries(1):
+            results = self._run(queryset)
+        self.assertEqual(results[0], expected)
+
+    def test_values_with_joined_lookup(self):
+        # joined lookups force col1/col2 aliases in the compiled sql, the
+        # result dicts must still come back keyed by the lookup names
+        queryset = StoreProduct.objects.order_by("id").values("id", "category__name")
+        expected = list(queryset)
+        with self.assertNumQueries(1):
+            results = self._run(queryset)
+        self.assertEqual(results[0], expected)
+
+    def test_values_with_annotation(self):
+        queryset = (
+            StoreProduct.objects.values("store")
+            .annotate(product_count=Count("id"))
+            .order_by("store")
+        )
+        expected = list(queryset)
+        with self.assertNumQueries(1):
+            results = self._run(queryset)
+        self.assertEqual(results[0], expected)
+
+    def test_values_with_duplicate_underlying_column(self):
+        # "category" and "category_id" resolve to the same db column; without
+        # distinct col aliases the json keys would collapse and one entry
+        # would silently vanish from every row
+        queryset = StoreProduct.objects.order_by("id").values("category", "category_id")
+        expected = list(queryset)
+        with self.assertNumQueries(1):
+            results = self._run(queryset)
+        self.assertEqual(results[0], expected)
+
+    def test_float_inside_json_field_stays_float(self):
+        # parse_float=Decimal on the cursor must not leak into JSONField
+        # payloads, floats there have to come back as plain floats
+        StoreProduct.objects.filter(id=self.product_1.id).update(meta={"ratio": 1.5})
+        queryset = StoreProduct.objects.filter(id=self.product_1.id).values(
+            "id", "meta"
+        )
+        expected = list(queryset)
+        with self.assertNumQueries(1):
+            results = self._run(queryset)
+        self.assertEqual(results[0], expected)
+        self.assertIsInstance(results[0][0]["meta"]["ratio"], float)
+
+    def test_flat_values_list(self):
+        queryset = StoreProduct.objects.order_by("id").values_list("id", flat=True)
+        expected = list(queryset)
+        with self.assertNumQueries(1):
+            results = self._run(queryset)
+        self.assertEqual(results[0], expected)
+
+    def test_values_list(self):
+        queryset = StoreProduct.objects.order_by("id").values_list("id", "name")
+        # this path returns rows as lists rather than tuples
+        expected = [list(row) for row in queryset]
+        with self.assertNumQueries(1):
+            results = self._run(queryset)
+        self.assertEqual(results[0], expected)
@@ -0,0 +1,8 @@
+from django_querysets_single_query_fetch.service import QuerysetsSingleQueryFetch
+
+
+class SingleQueryFetchTestMixin:
+    """Shared shorthand for the repeated fetch-and-execute pattern."""
+
+    def _run(self, *querysets):
+        return QuerysetsSingleQueryFetch(querysets=list(querysets)).execute()